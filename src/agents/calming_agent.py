@@ -1,5 +1,6 @@
+from google.genai import types
 from google.adk.agents import LlmAgent 
-from src.config import DEFAULT_MODEL
+from src.config import CALMING_MODEL
 
 def create_calming_agent() -> LlmAgent:
     """
@@ -19,9 +20,13 @@ Your job:
 """
 
     calming_agent = LlmAgent(
-        model=DEFAULT_MODEL,
+        model=CALMING_MODEL,
         instruction=instruction,
         name="calming_agent",
+        include_contents="none",
+        generate_content_config=types.GenerateContentConfig(
+            max_output_tokens=60,
+        ),
     )
 
     return calming_agent
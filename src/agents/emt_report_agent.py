@@ -1,4 +1,5 @@
 from typing import List, Dict, Any
+from google.genai import types
 from google.adk.agents import LlmAgent  
 from src.config import DEFAULT_MODEL
 
@@ -12,10 +13,13 @@ def create_emt_report_agent() -> LlmAgent:
 You are an assistant that summarizes an emergency event for paramedics (EMTs).
 
 You will be given:
-- A list of time-ordered events describing the emergency, including:
+- A list of time-ordered events (one JSON object per line) describing
+  the emergency, including:
   - user messages,
   - triage agent outputs,
   - key actions taken (CPR, EpiPen, recovery position, etc.)
+- On long sessions, a short summary of the earlier events that precedes
+  the list.
 
 Your task:
 1. Produce a concise, factual report including:
@@ -33,6 +37,10 @@ Your task:
         model=DEFAULT_MODEL,
         instruction=instruction,
         name="emt_report_agent",
+        include_contents="none",
+        generate_content_config=types.GenerateContentConfig(
+            max_output_tokens=600,
+        ),
     )
 
     return emt_agent
@@ -1,8 +1,18 @@
-from google.genai import types  
+from pydantic import BaseModel
+from google.genai import types
 from google.adk.agents import LlmAgent 
 from src.config import DEFAULT_MODEL
 
 
+class InstructionOutput(BaseModel):
+    """
+    Structured output schema for the instruction agent.
+    """
+    next_step_index: int
+    done: bool
+    next_step_message: str
+
+
 def create_instruction_agent() -> LlmAgent:
     """
     Creates an LlmAgent that guides the user through protocol steps.
@@ -48,6 +58,12 @@ Do NOT include any other text before or after the JSON.
         model=DEFAULT_MODEL,
         instruction=instruction,
         name="instruction_agent",
+        include_contents="none",
+        output_schema=InstructionOutput,
+        generate_content_config=types.GenerateContentConfig(
+            max_output_tokens=150,
+            temperature=0.1,
+        ),
     )
 
     return instruction_agent
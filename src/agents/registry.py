@@ -0,0 +1,30 @@
+from functools import lru_cache
+
+from google.adk.agents import LlmAgent
+from src.agents.triage_agent import create_triage_agent
+from src.agents.instruction_agent import create_instruction_agent
+from src.agents.calming_agent import create_calming_agent
+from src.agents.emt_report_agent import create_emt_report_agent
+
+
+# Agents are stateless config containers, so each one is built once per
+# process and shared by every orchestrator (e.g. under run_eval's fan-out).
+
+@lru_cache(maxsize=None)
+def get_triage_agent() -> LlmAgent:
+    return create_triage_agent()
+
+
+@lru_cache(maxsize=None)
+def get_instruction_agent() -> LlmAgent:
+    return create_instruction_agent()
+
+
+@lru_cache(maxsize=None)
+def get_calming_agent() -> LlmAgent:
+    return create_calming_agent()
+
+
+@lru_cache(maxsize=None)
+def get_emt_report_agent() -> LlmAgent:
+    return create_emt_report_agent()
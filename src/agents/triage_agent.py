@@ -1,41 +1,71 @@
-from typing import Dict, Any 
-from google.genai import types  
+from enum import Enum
+from typing import List
+from pydantic import BaseModel
+from google.genai import types
 from google.adk.agents import LlmAgent 
 from src.config import DEFAULT_MODEL, EMERGENCY_TYPES
 
 
-def create_triage_agent() -> LlmAgent:
-    """
-    Creates an LlmAgent responsible for classifying the emergency type.
+# Enum over EMERGENCY_TYPES, so decoding is constrained to known labels
+EmergencyType = Enum("EmergencyType", {t: t for t in EMERGENCY_TYPES}, type=str)
 
-    The agent MUST:
-      - Pick one emergency_type from EMERGENCY_TYPES
-      - Return JSON with fields: emergency_type, confidence, summary, red_flags
+
+class TriageOutput(BaseModel):
+    """
+    Structured output schema for the triage agent.
     """
+    emergency_type: EmergencyType
+    confidence: float
+    summary: str
+    red_flags: List[str]
+    initial_reassurance: str
+
+
+# Built once per process rather than on every create_triage_agent() call
+_EMERGENCY_TYPES_TEXT = ", ".join(EMERGENCY_TYPES)
 
-    instruction = f"""
+_TRIAGE_INSTRUCTION = f"""
 You are an emergency triage assistant.
 
 Your job:
 1. Read the user's description of a situation.
 2. Decide what type of emergency this is, choosing from:
-   {EMERGENCY_TYPES}
+   {_EMERGENCY_TYPES_TEXT}
 3. Identify red-flag symptoms mentioned.
 4. Return ONLY a valid JSON object with these fields:
-   - emergency_type: one of {EMERGENCY_TYPES}
+   - emergency_type: one of {_EMERGENCY_TYPES_TEXT}
    - confidence: float between 0 and 1
    - summary: short natural language summary
    - red_flags: list of strings
+   - initial_reassurance: ONE short, calm sentence for the user (emotional
+     support only, no medical instructions), shown with the first step
 
 CRITICAL RULES:
 - Output MUST be valid JSON.
 - Do not include any extra text, apologies, or explanations outside the JSON.
 """
 
+
+def create_triage_agent() -> LlmAgent:
+    """
+    Creates an LlmAgent responsible for classifying the emergency type.
+
+    The agent MUST:
+      - Pick one emergency_type from EMERGENCY_TYPES
+      - Return JSON with fields: emergency_type, confidence, summary, red_flags,
+        initial_reassurance
+    """
+
     triage_agent = LlmAgent(
         model=DEFAULT_MODEL,
-        instruction=instruction,
+        instruction=_TRIAGE_INSTRUCTION,
         name="triage_agent",
+        include_contents="none",
+        output_schema=TriageOutput,
+        generate_content_config=types.GenerateContentConfig(
+            max_output_tokens=250,
+            temperature=0.1,
+        ),
     )
 
     return triage_agent
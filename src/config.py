@@ -1,8 +1,22 @@
-from google.adk.models.google_llm import Gemini  
+import httpx
+
+from src.util.pooled_gemini import PooledGemini
 
 APP_NAME = "LifeSaverEmergencyAgent"
 
-DEFAULT_MODEL = Gemini(model="gemini-2.5-flash-lite")
+# Shared httpx settings for the google.genai client behind every model:
+# HTTP/2, so concurrent agent calls multiplex over one connection, and a
+# keep-alive pool sized for run_eval's fan-out.
+ASYNC_CLIENT_ARGS = {
+    "http2": True,
+    "limits": httpx.Limits(max_connections=64, max_keepalive_connections=32),
+}
+
+DEFAULT_MODEL = PooledGemini(model="gemini-2.5-flash-lite", async_client_args=ASYNC_CLIENT_ARGS)
+
+# Calming messages are 1-2 sentences of non-medical reassurance, so they run
+# on a cheaper, lower-latency tier than the medical agents.
+CALMING_MODEL = PooledGemini(model="gemini-2.0-flash-lite", async_client_args=ASYNC_CLIENT_ARGS)
 
 # List of supported emergency types (used by triage + protocol tools)
 EMERGENCY_TYPES = [
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import uuid
@@ -5,12 +6,20 @@ from dataclasses import asdict
 from typing import List, Dict, Any
 from src.orchestrator import LifeSaverOrchestrator, LifeSaverContext
 
+try:
+    import uvloop
+except ImportError:  # optional; not available on Windows
+    uvloop = None
+
 
 EVAL_FILE_PATH = os.path.join(
     os.path.dirname(__file__),
     "eval_scenarios.json"
 )
 
+# Upper bound on scenarios in flight at once (keeps us under Gemini rate limits)
+MAX_CONCURRENCY = int(os.environ.get("LIFESAVER_EVAL_CONCURRENCY", "8"))
+
 
 class ScenarioResult:
     """
@@ -53,9 +62,10 @@ def load_eval_scenarios() -> List[Dict[str, Any]]:
     return data
 
 
-def run_single_scenario(
+async def arun_single_scenario(
     orchestrator: LifeSaverOrchestrator,
     scenario: Dict[str, Any],
+    semaphore: asyncio.Semaphore,
 ) -> ScenarioResult:
     """
     Run one full scenario:
@@ -64,73 +74,81 @@ def run_single_scenario(
       - EMT report
       - scoring
 
+    Scenarios run concurrently, so console output is buffered and printed
+    in one block once the scenario finishes.
+
     Returns a ScenarioResult.
     """
-    session_id = str(uuid.uuid4())
-    ctx: LifeSaverContext = orchestrator.start_session(session_id=session_id)
-
-    scenario_id = scenario["id"]
-    first_message = scenario["first_message"]
-    expected_type = scenario["expected_emergency_type"]
-    expected_phrases = scenario.get("expected_actions_include", [])
-
-    print("=" * 70)
-    print(f"Scenario: {scenario_id}")
-    print(f"Description: {scenario.get('description', '')}")
-    print(f"User first message: {first_message}")
-
-    # --- TRIAGE ---
-    ctx = orchestrator.triage(ctx, first_message)
-
-    predicted_type = ctx.emergency_type or "unknown"
-    classification_ok = (predicted_type == expected_type)
-
-    print(f"Predicted emergency_type: {predicted_type}")
-    print(f"Expected emergency_type:  {expected_type}")
-    print(f"Classification OK?       {classification_ok}")
-
-    # --- INSTRUCTION LOOPS ---
-    for update in scenario.get("user_updates", []):
-        print(f"\nUser update: {update}")
-        result = orchestrator.next_instruction(ctx, update)
-        instr_msg = result["instruction_message"]
-        calm_msg = result["calming_message"]
-        done = result["done"]
-
-        print(f"Instruction Agent: {instr_msg}")
-        print(f"Calming Agent:     {calm_msg}")
-
-        if done:
-            print("[Instruction agent marked sequence as done]")
-            break
-
-    # --- EMT REPORT ---
-    report = orchestrator.generate_emt_report(ctx)
-    print("\n=== EMT Report (truncated for console) ===")
-    # Just show first ~500 chars in console
-    print(report[:500] + ("..." if len(report) > 500 else ""))
-
-    report_lower = report.lower()
-    missing_phrases: List[str] = []
-    for phrase in expected_phrases:
-        if phrase.lower() not in report_lower:
-            missing_phrases.append(phrase)
-
-    if missing_phrases:
-        print("\nMissing expected phrases in EMT report:")
-        for mp in missing_phrases:
-            print(f" - {mp}")
-    else:
-        print("\nAll expected phrases found in EMT report.")
-
-    return ScenarioResult(
-        scenario_id=scenario_id,
-        expected_type=expected_type,
-        predicted_type=predicted_type,
-        classification_ok=classification_ok,
-        expected_phrases=expected_phrases,
-        missing_phrases=missing_phrases,
-    )
+    async with semaphore:
+        session_id = str(uuid.uuid4())
+        await orchestrator.setup_sessions(user_id=session_id, session_id=session_id)
+        ctx: LifeSaverContext = orchestrator.start_session(session_id=session_id)
+
+        scenario_id = scenario["id"]
+        first_message = scenario["first_message"]
+        expected_type = scenario["expected_emergency_type"]
+        expected_phrases = scenario.get("expected_actions_include", [])
+
+        lines: List[str] = []
+        lines.append("=" * 70)
+        lines.append(f"Scenario: {scenario_id}")
+        lines.append(f"Description: {scenario.get('description', '')}")
+        lines.append(f"User first message: {first_message}")
+
+        # --- TRIAGE ---
+        ctx = await orchestrator.atriage(ctx, first_message)
+
+        predicted_type = ctx.emergency_type or "unknown"
+        classification_ok = (predicted_type == expected_type)
+
+        lines.append(f"Predicted emergency_type: {predicted_type}")
+        lines.append(f"Expected emergency_type:  {expected_type}")
+        lines.append(f"Classification OK?       {classification_ok}")
+
+        # --- INSTRUCTION LOOPS ---
+        for update in scenario.get("user_updates", []):
+            lines.append(f"\nUser update: {update}")
+            result = await orchestrator.anext_instruction(ctx, update)
+            instr_msg = result["instruction_message"]
+            calm_msg = result["calming_message"]
+            done = result["done"]
+
+            lines.append(f"Instruction Agent: {instr_msg}")
+            lines.append(f"Calming Agent:     {calm_msg}")
+
+            if done:
+                lines.append("[Instruction agent marked sequence as done]")
+                break
+
+        # --- EMT REPORT ---
+        report = await orchestrator.agenerate_emt_report(ctx)
+        lines.append("\n=== EMT Report (truncated for console) ===")
+        # Just show first ~500 chars in console
+        lines.append(report[:500] + ("..." if len(report) > 500 else ""))
+
+        report_lower = report.lower()
+        missing_phrases: List[str] = []
+        for phrase in expected_phrases:
+            if phrase.lower() not in report_lower:
+                missing_phrases.append(phrase)
+
+        if missing_phrases:
+            lines.append("\nMissing expected phrases in EMT report:")
+            for mp in missing_phrases:
+                lines.append(f" - {mp}")
+        else:
+            lines.append("\nAll expected phrases found in EMT report.")
+
+        print("\n".join(lines))
+
+        return ScenarioResult(
+            scenario_id=scenario_id,
+            expected_type=expected_type,
+            predicted_type=predicted_type,
+            classification_ok=classification_ok,
+            expected_phrases=expected_phrases,
+            missing_phrases=missing_phrases,
+        )
 
 
 def summarize_results(results: List[ScenarioResult]) -> None:
@@ -164,18 +182,27 @@ def summarize_results(results: List[ScenarioResult]) -> None:
             print("  EMT report includes all expected phrases.")
 
 
-def main():
+async def amain() -> None:
     scenarios = load_eval_scenarios()
+    # One orchestrator is enough: all per-session state lives in
+    # LifeSaverContext and the ADK sessions are scoped by session_id.
     orchestrator = LifeSaverOrchestrator()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    await orchestrator.awarmup()
 
-    all_results: List[ScenarioResult] = []
-
-    for scenario in scenarios:
-        result = run_single_scenario(orchestrator, scenario)
-        all_results.append(result)
+    all_results: List[ScenarioResult] = await asyncio.gather(
+        *(arun_single_scenario(orchestrator, s, semaphore) for s in scenarios)
+    )
+    orchestrator.close()
 
     summarize_results(all_results)
 
 
+def main():
+    # uvloop's event loop is a drop-in, faster replacement for asyncio's;
+    # it pays off most with many scenarios in flight.
+    (uvloop.run if uvloop else asyncio.run)(amain())
+
+
 if __name__ == "__main__":
     main()
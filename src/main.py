@@ -1,6 +1,15 @@
+import asyncio
 import uuid
 
-def demo_simple_flow():
+from src.orchestrator import LifeSaverOrchestrator
+
+try:
+    import uvloop
+except ImportError:  # optional; not available on Windows
+    uvloop = None
+
+
+async def demo_simple_flow():
     """
     Quick-and-dirty demonstration of the LifeSaverOrchestrator.
     Run this locally to sanity check everything is wired correctly.
@@ -8,12 +17,20 @@ def demo_simple_flow():
     orchestrator = LifeSaverOrchestrator()
     session_id = str(uuid.uuid4())
 
+    await asyncio.gather(
+        orchestrator.setup_sessions(user_id=session_id, session_id=session_id),
+        orchestrator.awarmup(),
+    )
     ctx = orchestrator.start_session(session_id=session_id)
 
     print("=== LifeSaver Emergency Demo ===")
     first_message = "My dad just collapsed and he's not breathing."
     print(f"User: {first_message}")
-    ctx = orchestrator.triage(ctx, first_message)
+    ctx = await orchestrator.atriage(ctx, first_message)
+
+    first = orchestrator.first_instruction(ctx)
+    print(f"Instruction Agent: {first['instruction_message']}")
+    print(f"Calming Agent: {first['calming_message']}")
 
     # Simulate a couple of instruction loops:
     user_updates = [
@@ -23,7 +40,7 @@ def demo_simple_flow():
     ]
 
     for update in user_updates:
-        result = orchestrator.next_instruction(ctx, update)
+        result = await orchestrator.anext_instruction(ctx, update)
         instr = result["instruction_message"]
         calm = result["calming_message"]
         done = result["done"]
@@ -35,10 +52,13 @@ def demo_simple_flow():
             print("\n[Instruction sequence marked as done by agent]")
             break
 
-    report = orchestrator.generate_emt_report(ctx)
+    report = await orchestrator.agenerate_emt_report(ctx)
     print("\n=== EMT Report ===")
     print(report)
 
+    orchestrator.close()
+
 
 if __name__ == "__main__":
-    demo_simple_flow()
+    # uvloop's event loop is a drop-in, faster replacement for asyncio's
+    (uvloop.run if uvloop else asyncio.run)(demo_simple_flow())
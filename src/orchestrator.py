@@ -1,29 +1,234 @@
+import asyncio
+import contextlib
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import (
+    List, Dict, Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Deque, Optional, TypeVar,
+)
 
+import orjson
 from google.genai import types
+from google.adk.agents import LlmAgent
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.apps import App
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 
-from src.agents.triage_agent import create_triage_agent
-from src.agents.instruction_agent import create_instruction_agent
-from src.agents.calming_agent import create_calming_agent
-from src.agents.emt_report_agent import create_emt_report_agent
+from src.agents.registry import (
+    get_calming_agent,
+    get_emt_report_agent,
+    get_instruction_agent,
+    get_triage_agent,
+)
 from src.tools.protocol import get_protocol
-from src.config import APP_NAME
-import json
+from src.util.coalescer import CoalescingRunner
+from src.util.response_cache import CachedRunner, ExactMatchCache
+from src.util.semantic_cache import SemanticCache
+from src.util.sliding_window_session import SlidingWindowSessionService
+from src.config import APP_NAME, DEFAULT_MODEL, EMERGENCY_TYPES
+
+__all__ = ["LifeSaverOrchestrator", "LifeSaverContext", "LifeSaverEvent"]
+
+logger = logging.getLogger(__name__)
+
+
+# One Runner (and one ADK app / session) per agent role, so agents never
+# append to the same session concurrently.
+AGENT_ROLES = ("triage", "instruction", "calming", "emt")
+APP_NAMES = tuple(APP_NAME + "_" + role for role in AGENT_ROLES)
+
+# Keyword fallback when the triage agent's output is unusable; checked in order
+TRIAGE_KEYWORDS = {
+    "anaphylaxis": ("anaphyla", "allerg", "epipen", "epi-pen", "hives", "swelling", "bee sting"),
+    "choking": ("chok", "heimlich", "something stuck"),
+    "possible_stroke": ("stroke", "droop", "slurr", "one side of"),
+    "cardiac_arrest": ("cardiac", "heart attack", "not breathing", "isn't breathing", "no pulse"),
+    "unconscious_but_breathing": ("unconscious", "passed out", "fainted", "unresponsive"),
+}
+DEFAULT_EMERGENCY_TYPE = "unconscious_but_breathing"
+
+# Token streaming (SSE) for agent calls whose output is used as it arrives
+STREAM_RUN_CONFIG = RunConfig(streaming_mode=StreamingMode.SSE)
+
+# Embedding model for the triage semantic cache
+TRIAGE_EMBEDDING_MODEL = "text-embedding-004"
+
+# How long triage waits for the cache lookup's embedding before calling the
+# triage agent anyway (seconds)
+TRIAGE_CACHE_TIMEOUT_S = 0.15
+
+# User updates that only confirm the current step (compared lowercased,
+# without trailing punctuation)
+CONFIRM_PHRASES = frozenset({"done", "ok", "okay", "yes", "yep", "doing it", "doing", "next"})
+
+# Hard cap on ctx.events. Compaction (events_recent_cap) normally keeps the
+# log far below this; the cap only bounds memory if it can't keep up.
+MAX_EVENTS = 128
+
+# Event types that carry no medical information and are left out of EMT input
+EMT_EXCLUDED_EVENT_TYPES = frozenset({"calming_output_raw", "calming_output_cached"})
+
+# Calming messages for turns where a model call adds nothing (empty update,
+# or the last step repeating); same register as the calming agent's output
+DEFAULT_CALM_MESSAGE = (
+    "You’re doing the right thing. Keep going with the current step; "
+    "help is on the way."
+)
+_STATIC_CALM = {
+    "cardiac_arrest": (
+        "You’re doing the right thing. Stay focused and keep going; help is on the way."
+    ),
+    "choking": "You’re doing well. Stay with them and keep going; help is on the way.",
+    "possible_stroke": (
+        "You’re doing the right thing by staying with them. Help is on the way."
+    ),
+    "anaphylaxis": "You’re handling this well. Stay calm and stay with them; help is on the way.",
+    "unconscious_but_breathing": (
+        "You’re doing the right thing. Stay close to them; help is on the way."
+    ),
+}
+
+T = TypeVar("T")
+
+# Calming agent input, as a bound str.format for the per-turn hot path
+_CALM_TMPL = (
+    "The user said: '{user_update}'. "
+    "They are on step index {step_index} "
+    "of protocol '{title}'. "
+    "Respond with a short, calm reassurance message."
+).format
+
+SUMMARIZE_EVENTS_PROMPT = (
+    "Summarize briefly, for a later EMT handoff report, the earlier summary "
+    "and events below. Keep symptoms, actions taken, medications and their "
+    "order; drop everything else. Reply with the summary text only.\n\n"
+)
+
+
+# Bound once; every agent call wraps its input in these
+_Content = types.Content
+_Part = types.Part
+
+
+def _user_content(text: str) -> types.Content:
+    return _Content(role="user", parts=[_Part(text=text)])
+
+
+def _keyword_triage(user_message: str) -> str:
+    """
+    Cheap, LLM-free classification by keyword scan of the user's message.
+    """
+    text = user_message.lower()
+    for emergency_type, keywords in TRIAGE_KEYWORDS.items():
+        if any(keyword in text for keyword in keywords):
+            return emergency_type
+    return DEFAULT_EMERGENCY_TYPE
 
 
-# ---------------------- Context dataclass ---------------------- #
+def _is_confirmation(user_update: str) -> bool:
+    """
+    True if the update is a bare confirmation such as "ok" or "done!".
+    """
+    return user_update.strip().lower().rstrip(".!") in CONFIRM_PHRASES
 
-@dataclass
+
+# ---------------------- Context dataclasses -------------------- #
+
+@dataclass(slots=True)
+class LifeSaverEvent:
+    """
+    One entry of the session event log (user messages, agent outputs, ...).
+    """
+    type: str
+    content: Any
+
+
+@dataclass(slots=True)
 class LifeSaverContext:
     session_id: str
     emergency_type: Optional[str] = None
     protocol: Optional[Dict[str, Any]] = None
     current_step_index: int = 0
     done: bool = False
-    events: List[Dict[str, Any]] = field(default_factory=list)
+    events: Deque[LifeSaverEvent] = field(default_factory=lambda: deque(maxlen=MAX_EVENTS))
+    # Rolling summary of events compacted out of `events`
+    events_summary: str = ""
+    events_recent_cap: int = 30
+    # JSON line per entry of `events` ("" for EMT-excluded types), kept in
+    # step with it so the EMT report doesn't re-serialize the whole log
+    events_lines: Deque[str] = field(
+        default_factory=lambda: deque(maxlen=MAX_EVENTS), repr=False, compare=False
+    )
+    # EMT-relevant events evicted at the MAX_EVENTS cap before compaction
+    # could summarize them
+    events_dropped: int = 0
+    # JSON of protocol["title"] / protocol["steps"], serialized once when the
+    # protocol is set since they don't change for the rest of the session
+    _title_json: str = field(default="", init=False, repr=False, compare=False)
+    _steps_json: str = field(default="", init=False, repr=False, compare=False)
+    # Calming sentence for the first step, produced by the triage call itself
+    _initial_reassurance: str = field(default="", init=False, repr=False, compare=False)
+    # Background _compact_events run, if one was started (at most one at a time)
+    _compaction_task: Optional["asyncio.Task[None]"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def add_event(self, type: str, content: Any) -> None:
+        # At the cap, the deques evict the oldest event (and its line)
+        if len(self.events) == self.events.maxlen and self.events_lines[0]:
+            self.events_dropped += 1
+
+        event = LifeSaverEvent(type, content)
+        self.events.append(event)
+        if type in EMT_EXCLUDED_EVENT_TYPES:
+            self.events_lines.append("")
+        else:
+            self.events_lines.append(orjson.dumps(event).decode() + "\n")
+
+    def drop_oldest_events(self, count: int) -> List[LifeSaverEvent]:
+        """
+        Remove and return the oldest `count` events, keeping events_lines in sync.
+        """
+        count = min(count, len(self.events))
+        for _ in range(count):
+            self.events_lines.popleft()
+        return [self.events.popleft() for _ in range(count)]
+
+
+class _CalmingStream:
+    """
+    The `calming_message` iterator of a stream=True turn.
+
+    Wraps the `_astream_calming` generator so that closing it before the
+    first chunk still records the turn; a generator that never started
+    doesn't run its finally block on aclose().
+    """
+
+    __slots__ = ("_chunks", "_on_unstarted_close", "_started")
+
+    def __init__(
+        self,
+        chunks: AsyncGenerator[str, None],
+        on_unstarted_close: Callable[[], None],
+    ) -> None:
+        self._chunks = chunks
+        self._on_unstarted_close = on_unstarted_close
+        self._started = False
+
+    def __aiter__(self) -> "_CalmingStream":
+        return self
+
+    def __anext__(self) -> Awaitable[str]:
+        self._started = True
+        return self._chunks.__anext__()
+
+    async def aclose(self) -> None:
+        if not self._started:
+            self._started = True
+            self._on_unstarted_close()
+        await self._chunks.aclose()
 
 
 # ---------------------- Orchestrator --------------------------- #
@@ -32,66 +237,173 @@ class LifeSaverOrchestrator:
     """
     High-level orchestrator for the LifeSaver multi-agent workflow.
 
-    - Uses one shared InMemorySessionService.
-    - One Runner per agent.
+    - Uses one shared in-memory session service; sessions are trimmed to a
+      sliding window of events after each agent call.
+    - One Runner per agent, driven through `runner.run_async`, each with
+      its own ADK app name and session.
     - You must call `await setup_sessions(user_id, session_id)` ONCE
       before using triage / next_instruction / generate_emt_report.
+    - The workflow steps are coroutines (`atriage`, `anext_instruction`,
+      `agenerate_emt_report`), so async callers (servers, run_eval) never
+      block their event loop; the un-prefixed methods are sync wrappers.
     """
 
     def __init__(self) -> None:
-        # Shared session service for all runners
-        self.session_service = InMemorySessionService()
-
-        # Agents
-        self.triage_agent = create_triage_agent()
-        self.instruction_agent = create_instruction_agent()
-        self.calming_agent = create_calming_agent()
-        self.emt_report_agent = create_emt_report_agent()
-
-        # Runners (session_service is REQUIRED)
-        self.triage_runner = Runner(
-            agent=self.triage_agent,
-            app_name=APP_NAME + "_triage",
-            session_service=self.session_service,
-        )
-        self.instruction_runner = Runner(
-            agent=self.instruction_agent,
-            app_name=APP_NAME + "_instruction",
-            session_service=self.session_service,
-        )
-        self.calming_runner = Runner(
-            agent=self.calming_agent,
-            app_name=APP_NAME + "_calming",
-            session_service=self.session_service,
+        # Shared session service for all runners; ctx.events is the full log,
+        # so the ADK sessions only keep a short window of recent events.
+        self.session_service = SlidingWindowSessionService(max_events=8)
+
+        # Agents (process-wide singletons, see src/agents/registry.py)
+        self.triage_agent = get_triage_agent()
+        self.instruction_agent = get_instruction_agent()
+        self.calming_agent = get_calming_agent()
+        self.emt_report_agent = get_emt_report_agent()
+
+        # Runners (session_service is REQUIRED). Built concurrently so any
+        # I/O done during Runner/App construction isn't paid four times over.
+        # Agents share model instances, and with them the API client /
+        # connection pool, so separate runners don't multiply connections.
+        agents = (
+            self.triage_agent,
+            self.instruction_agent,
+            self.calming_agent,
+            self.emt_report_agent,
         )
-        self.emt_runner = Runner(
-            agent=self.emt_report_agent,
-            app_name=APP_NAME + "_emt",
-            session_service=self.session_service,
+        with ThreadPoolExecutor(max_workers=len(AGENT_ROLES)) as executor:
+            futures = {
+                role: executor.submit(self._build_runner, agent, app_name)
+                for role, agent, app_name in zip(AGENT_ROLES, agents, APP_NAMES)
+            }
+            self.runners: Dict[str, Runner] = {
+                role: future.result() for role, future in futures.items()
+            }
+
+        # The calming agent is stateless and non-medical, so identical prompts
+        # ("ok", "done", ...) can be answered from an exact-match cache, and
+        # identical prompts already in flight are coalesced into one call.
+        self.runners["calming"] = CachedRunner(
+            inner=CoalescingRunner(inner=self.runners["calming"]),
+            cache=ExactMatchCache(max_entries=512, ttl_seconds=3600),
         )
 
+        # Triage decisions (emergency_type + red_flags only) for paraphrased
+        # first messages, so "my father collapsed, not breathing" reuses the
+        # label already given to "my dad collapsed and isn't breathing".
+        self.triage_cache = SemanticCache(embed_fn=self._embed)
+
+        # Event loop behind the synchronous wrappers, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    def _run_sync(self, coro: Awaitable[T]) -> T:
+        """
+        Run `coro` to completion on the orchestrator's background event loop.
+
+        Unlike asyncio.run(), the loop outlives the call: the Gemini client is
+        created per event loop, so reusing one keeps its HTTP connections warm
+        across turns. It also works when the caller already runs a loop
+        (e.g. a notebook).
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="lifesaver-orchestrator-loop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self) -> None:
+        """
+        Shut down the background event loop behind the sync wrappers, if it
+        was started: cancel its pending tasks (e.g. a background compaction),
+        stop it, join its thread and close it. A later sync call starts a
+        new loop. Don't call this from a coroutine running on that loop.
+        """
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None:
+            return
+
+        async def shutdown() -> None:
+            tasks = asyncio.all_tasks() - {asyncio.current_task()}
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _build_runner(self, agent: LlmAgent, app_name: str) -> Runner:
+        """
+        Wrap an agent in its own ADK App and Runner.
+
+        No context cache is configured: Gemini only caches prompts of at least
+        2048 tokens, and every agent prompt here is far below that.
+        """
+        app = App(name=app_name, root_agent=agent)
+        return Runner(app=app, session_service=self.session_service)
+
     # ---------- Session setup (call once) ----------
 
     async def setup_sessions(self, user_id: str, session_id: str) -> None:
         """
-        Create ADK sessions for all four runners.
+        Create the ADK session for each of the four runners (concurrently).
 
         Call ONCE in the notebook:
             await orchestrator.setup_sessions(user_id=session_id, session_id=session_id)
         """
-        app_names = [
-            APP_NAME + "_triage",
-            APP_NAME + "_instruction",
-            APP_NAME + "_calming",
-            APP_NAME + "_emt",
-        ]
-
-        for app_name in app_names:
-            await self.session_service.create_session(
-                app_name=app_name,
-                user_id=user_id,
-                session_id=session_id,
+        await asyncio.gather(
+            *(
+                self.session_service.create_session(
+                    app_name=app_name,
+                    user_id=user_id,
+                    session_id=session_id,
+                )
+                for app_name in APP_NAMES
+            )
+        )
+
+    async def awarmup(self) -> None:
+        """
+        Open the Gemini API connections ahead of the first user message, so
+        triage doesn't pay the TCP/TLS handshake.
+
+        Issues one cheap model-metadata request per distinct model (no
+        tokens, nothing written to any session). Clients are created per
+        event loop, so await this on the loop that will serve requests.
+        Failures are ignored: warmup is best-effort.
+        """
+        models = {
+            id(agent.model): agent.model
+            for agent in (
+                self.triage_agent,
+                self.instruction_agent,
+                self.calming_agent,
+                self.emt_report_agent,
             )
+            if not isinstance(agent.model, str)
+        }
+
+        async def ping(model: Any) -> None:
+            with contextlib.suppress(Exception):
+                await model.api_client.aio.models.get(model=model.model)
+
+        await asyncio.gather(*(ping(model) for model in models.values()))
+
+    def warmup(self) -> None:
+        """
+        Synchronous wrapper around `awarmup` (warms the loop the sync
+        wrappers run on).
+        """
+        self._run_sync(self.awarmup())
 
     def start_session(self, session_id: str) -> LifeSaverContext:
         """
@@ -100,61 +412,125 @@ class LifeSaverOrchestrator:
         """
         return LifeSaverContext(session_id=session_id)
 
-    # ---------- Internal helper: run a Runner synchronously ----------
+    # ---------- Internal helper: run a Runner asynchronously ----------
 
-    def _run_and_get_text(
+    async def _arun_and_get_text(
         self,
         runner: Runner,
         session_id: str,
         content_text: str,
     ) -> str:
         """
-        Run an ADK Runner synchronously and return the final text response.
-
-        Uses runner.run(...) (a blocking generator), so NO asyncio.run()
-        in the notebook – avoids nested event loop issues.
+        Run an ADK Runner via runner.run_async(...) and return the final text
+        response. Being a coroutine, several agents can be awaited
+        concurrently on one event loop.
         """
-        content = types.Content(
-            role="user",
-            parts=[types.Part(text=content_text)],
-        )
-
         final_text = ""
 
-        for event in runner.run(
+        # Stop at the final response rather than draining trailing events;
+        # aclosing() shuts the runner's generator down right away.
+        events = runner.run_async(
             user_id=session_id,
             session_id=session_id,
-            new_message=content,
-        ):
-            if event.is_final_response() and event.content and event.content.parts:
-                part_text = event.content.parts[0].text or ""
-                if part_text:
-                    final_text = part_text
+            new_message=_user_content(content_text),
+        )
+        try:
+            async with contextlib.aclosing(events):
+                async for event in events:
+                    if event.is_final_response():
+                        if event.content and event.content.parts:
+                            final_text = event.content.parts[0].text or ""
+                        break
+        finally:
+            self._trim_session(runner, session_id)
 
         return final_text
 
-    # ---------- Public workflow steps ----------
+    async def _astream_text(
+        self,
+        runner: Runner,
+        session_id: str,
+        content_text: str,
+    ) -> AsyncIterator[str]:
+        """
+        Like `_arun_and_get_text`, but yields the response text in chunks as
+        it streams in. A response without partial events (e.g. served from a
+        cache) is yielded as a single chunk.
+        """
+        streamed = False
 
-    def triage(self, ctx: LifeSaverContext, user_message: str) -> LifeSaverContext:
+        events = runner.run_async(
+            user_id=session_id,
+            session_id=session_id,
+            new_message=_user_content(content_text),
+            run_config=STREAM_RUN_CONFIG,
+        )
+        try:
+            async with contextlib.aclosing(events):
+                async for event in events:
+                    if event.content and event.content.parts:
+                        part_text = event.content.parts[0].text or ""
+                    else:
+                        part_text = ""
+
+                    if event.partial:
+                        if part_text:
+                            streamed = True
+                            yield part_text
+                    elif event.is_final_response():
+                        if part_text and not streamed:
+                            yield part_text
+                        break
+        finally:
+            self._trim_session(runner, session_id)
+
+    def _trim_session(self, runner: Runner, session_id: str) -> None:
         """
-        Run triage on the first user message.
+        Cut the runner's stored ADK session back to the sliding window, once
+        an invocation on it has finished.
         """
-        ctx.events.append({"type": "user_message", "content": user_message})
+        self.session_service.trim_session(
+            app_name=runner.app_name,
+            user_id=session_id,
+            session_id=session_id,
+        )
 
-        triage_text = self._run_and_get_text(
-            runner=self.triage_runner,
-            session_id=ctx.session_id,
-            content_text=user_message,
+    async def _embed(self, text: str) -> List[float]:
+        """
+        Embed text with the same Gemini API client the agents use.
+        """
+        response = await DEFAULT_MODEL.api_client.aio.models.embed_content(
+            model=TRIAGE_EMBEDDING_MODEL,
+            contents=text,
         )
+        return response.embeddings[0].values
+
+    async def _arun_triage_agent(
+        self,
+        ctx: LifeSaverContext,
+        user_message: str,
+    ) -> Dict[str, Any]:
+        """
+        Call the triage agent and return its parsed JSON output.
 
-        ctx.events.append(
-            {"type": "triage_output_raw", "content": triage_text}
+        Not streamed: the output is only usable once the JSON is complete,
+        and the protocol lookup is too cheap to start early on a partial
+        emergency_type.
+        """
+        triage_text = await self._arun_and_get_text(
+            runner=self.runners["triage"],
+            session_id=ctx.session_id,
+            content_text=user_message,
         )
+        ctx.add_event("triage_output_raw", triage_text)
 
         # Parse JSON from the triage agent
         try:
-            triage_json = json.loads(triage_text)
-        except json.JSONDecodeError:
+            triage_json = orjson.loads(triage_text)
+        except orjson.JSONDecodeError:
+            triage_json = None
+
+        if not isinstance(triage_json, dict):
             triage_json = {
                 "emergency_type": None,
                 "confidence": 0.0,
@@ -162,38 +538,144 @@ class LifeSaverOrchestrator:
                 "red_flags": [],
             }
 
-        ctx.events.append(
-            {"type": "triage_output_parsed", "content": triage_json}
-        )
+        ctx.add_event("triage_output_parsed", triage_json)
+        return triage_json
 
-        ctx.emergency_type = triage_json.get("emergency_type") or "unconscious_but_breathing"
+    # ---------- Public workflow steps ----------
 
-        # Fetch protocol for this emergency type via our tool
-        protocol_resp = get_protocol(ctx.emergency_type)
-        ctx.events.append(
-            {"type": "protocol_lookup", "content": protocol_resp}
-        )
+    async def atriage(
+        self,
+        ctx: LifeSaverContext,
+        user_message: str,
+    ) -> LifeSaverContext:
+        """
+        Run triage on the first user message.
+        """
+        ctx.add_event("user_message", user_message)
+
+        # The triage agent is only called on a cache miss, or if the
+        # embedding for the lookup doesn't arrive within its time budget. In
+        # that case the embedding is left to finish, so the agent's answer
+        # can still be cached.
+        embed_task = asyncio.create_task(self.triage_cache.embed(user_message))
+        cache_later = False
+        try:
+            await asyncio.wait((embed_task,), timeout=TRIAGE_CACHE_TIMEOUT_S)
+
+            cached = None
+            if embed_task.done() and embed_task.result() is not None:
+                cached = self.triage_cache.get(embed_task.result())
+
+            if cached is not None:
+                ctx.add_event("triage_cache_hit", cached)
+                emergency_type = cached["emergency_type"]
+            else:
+                triage_json = await self._arun_triage_agent(ctx, user_message)
+
+                # Only trust the agent's label if it's one we have a protocol
+                # for; otherwise classify by keywords rather than paying for a
+                # retry.
+                emergency_type = triage_json.get("emergency_type")
+                if emergency_type in EMERGENCY_TYPES:
+                    ctx._initial_reassurance = triage_json.get("initial_reassurance") or ""
+                    # The reassurance is written for this user's message, so
+                    # it isn't cached; hits use the static calming message.
+                    entry = {
+                        "emergency_type": emergency_type,
+                        "red_flags": triage_json.get("red_flags", []),
+                    }
+                    embed_task.add_done_callback(lambda task: self._cache_triage(task, entry))
+                    cache_later = True
+                else:
+                    emergency_type = _keyword_triage(user_message)
+        finally:
+            if not cache_later:
+                embed_task.cancel()
+
+        ctx.emergency_type = emergency_type
+
+        # Fetch protocol for this emergency type via our tool. It's an
+        # in-memory lookup, so there is nothing to gain from starting it
+        # speculatively alongside the triage call.
+        protocol_resp = get_protocol(emergency_type)
+        ctx.add_event("protocol_lookup", protocol_resp)
 
         if protocol_resp["status"] != "success":
             raise RuntimeError(f"Protocol lookup failed: {protocol_resp['error_message']}")
 
         ctx.protocol = protocol_resp["data"]
+        ctx._title_json = orjson.dumps(ctx.protocol["title"]).decode()
+        ctx._steps_json = orjson.dumps(ctx.protocol["steps"]).decode()
         ctx.current_step_index = 0
         ctx.done = False
         return ctx
 
-    def next_instruction(
+    def _cache_triage(self, embed_task: "asyncio.Task[Any]", entry: Dict[str, Any]) -> None:
+        if not embed_task.cancelled() and embed_task.result() is not None:
+            self.triage_cache.put(embed_task.result(), entry)
+
+    def triage(self, ctx: LifeSaverContext, user_message: str) -> LifeSaverContext:
+        """
+        Synchronous wrapper around `atriage`.
+        """
+        return self._run_sync(self.atriage(ctx, user_message))
+
+    def first_instruction(self, ctx: LifeSaverContext) -> Dict[str, Any]:
+        """
+        The first step of the protocol, right after triage, with no LLM call:
+        the step comes from the protocol and the calming message from the
+        triage output (initial_reassurance), or a static message when triage
+        was served from the cache. Later turns use next_instruction.
+
+        Returns the same shape as `anext_instruction`.
+        """
+        if not ctx.protocol:
+            raise RuntimeError("Protocol is not set. Did you forget to run triage()?")
+
+        steps = ctx.protocol["steps"]
+        done = len(steps) == 1
+        calming_message = ctx._initial_reassurance.strip() or _STATIC_CALM.get(
+            ctx.emergency_type, DEFAULT_CALM_MESSAGE
+        )
+
+        ctx.add_event(
+            "instruction_output",
+            {"next_step_index": 0, "done": done, "next_step_message": steps[0]},
+        )
+        ctx.add_event("calming_output_cached", calming_message)
+        ctx.done = done
+
+        return {
+            "instruction_message": steps[0],
+            "calming_message": calming_message,
+            "done": done,
+            "ctx": ctx,
+        }
+
+    async def anext_instruction(
         self,
         ctx: LifeSaverContext,
         user_update: str,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         """
         Advance the protocol by one step (or repeat), based on user's update.
 
+        The instruction and calming agents are independent of each other, so
+        both are dispatched concurrently and the turn costs roughly the
+        slower of the two calls instead of their sum.
+
+        With stream=True this returns as soon as the calls are dispatched:
+        instruction_message comes from the protocol and is final, and
+        calming_message is an async iterator of text chunks. The turn (events,
+        step index) is recorded once that iterator is exhausted or closed
+        (aclose(), also before the first chunk), so consume or close it before
+        the next turn.
+
         Returns:
             {
                 "instruction_message": str,
-                "calming_message": str,
+                "calming_message": str (AsyncIterator[str] if stream),
                 "done": bool,
                 "ctx": LifeSaverContext
             }
@@ -202,56 +684,89 @@ class LifeSaverOrchestrator:
             raise RuntimeError("Protocol is not set. Did you forget to run triage()?")
 
         steps = ctx.protocol["steps"]
-        ctx.events.append({"type": "user_update", "content": user_update})
-
-        payload = {
-            "emergency_type": ctx.emergency_type,
-            "protocol_title": ctx.protocol["title"],
-            "steps": steps,
-            "current_step_index": ctx.current_step_index,
-            "user_update": user_update,
-        }
-
-        # Instruction agent call
-        instruction_text = self._run_and_get_text(
-            runner=self.instruction_runner,
-            session_id=ctx.session_id,
-            content_text=json.dumps(payload),
-        )
-        ctx.events.append(
-            {"type": "instruction_output_raw", "content": instruction_text}
-        )
+        ctx.add_event("user_update", user_update)
 
         # For now, just move to next step in the protocol
         next_step_index = min(ctx.current_step_index + 1, len(steps) - 1)
         done = next_step_index == len(steps) - 1
         instruction_message = steps[next_step_index]
+        step_output = {
+            "next_step_index": next_step_index,
+            "done": done,
+            "next_step_message": instruction_message,
+        }
 
-        ctx.current_step_index = next_step_index
-        ctx.done = done
+        if _is_confirmation(user_update):
+            # A bare "ok"/"done" just advances the step, which we decide
+            # deterministically anyway, so the instruction agent is skipped.
+            instruction_call = asyncio.sleep(0, result=step_output)
+        else:
+            # Only the per-turn fields are serialized here; steps and title
+            # were serialized once at triage.
+            instruction_call = self._arun_instruction_agent(
+                ctx,
+                f'{{"emergency_type":{orjson.dumps(ctx.emergency_type).decode()},'
+                f'"protocol_title":{ctx._title_json},'
+                f'"steps":{ctx._steps_json},'
+                f'"current_step_index":{ctx.current_step_index},'
+                f'"user_update":{orjson.dumps(user_update).decode()}}}',
+            )
 
-        # Calming agent call
-        calming_prompt = (
-            f"The user said: '{user_update}'. "
-            f"They are on step index {next_step_index} "
-            f"of protocol '{ctx.protocol['title']}'. "
-            "Respond with a short, calm reassurance message."
+        # Nothing new from the user, or the last step repeating: a canned
+        # message is as good as the model's, so the calming call is skipped.
+        static_calm = not user_update.strip() or next_step_index == ctx.current_step_index
+        static_message = _STATIC_CALM.get(ctx.emergency_type, DEFAULT_CALM_MESSAGE)
+        calming_prompt = _CALM_TMPL(
+            user_update=user_update,
+            step_index=next_step_index,
+            title=ctx.protocol["title"],
         )
 
-        calming_message = self._run_and_get_text(
-            runner=self.calming_runner,
-            session_id=ctx.session_id,
-            content_text=calming_prompt,
+        if stream:
+            instruction_task = asyncio.create_task(instruction_call)
+
+            def close_unstarted() -> None:
+                instruction_task.cancel()
+                self._finish_turn(ctx, next_step_index, done, step_output, "", static_calm)
+
+            return {
+                "instruction_message": instruction_message,
+                "calming_message": _CalmingStream(
+                    self._astream_calming(
+                        ctx,
+                        next_step_index,
+                        done,
+                        instruction_task,
+                        step_output,
+                        static_message if static_calm else None,
+                        calming_prompt,
+                    ),
+                    close_unstarted,
+                ),
+                "done": done,
+                "ctx": ctx,
+            }
+
+        if static_calm:
+            calming_call = asyncio.sleep(0, result=static_message)
+        else:
+            calming_call = self._arun_and_get_text(
+                runner=self.runners["calming"],
+                session_id=ctx.session_id,
+                content_text=calming_prompt,
+            )
+
+        # Instruction + calming agent calls, in parallel
+        instruction_output, calming_message = await asyncio.gather(
+            instruction_call,
+            calming_call,
         )
-        ctx.events.append(
-            {"type": "calming_output_raw", "content": calming_message}
+        self._finish_turn(
+            ctx, next_step_index, done, instruction_output, calming_message, static_calm
         )
 
         if not calming_message or not calming_message.strip():
-            calming_message = (
-                "You’re doing the right thing. Keep going with the current step; "
-                "help is on the way."
-            )
+            calming_message = DEFAULT_CALM_MESSAGE
 
         return {
             "instruction_message": instruction_message,
@@ -260,15 +775,212 @@ class LifeSaverOrchestrator:
             "ctx": ctx,
         }
 
-    def generate_emt_report(self, ctx: LifeSaverContext) -> str:
+    async def _arun_instruction_agent(self, ctx: LifeSaverContext, instruction_input: str) -> Any:
+        instruction_text = await self._arun_and_get_text(
+            runner=self.runners["instruction"],
+            session_id=ctx.session_id,
+            content_text=instruction_input,
+        )
+        # The agent is schema-constrained, so log its decision as
+        # structured data; keep the raw text if it still fails to parse.
+        try:
+            return orjson.loads(instruction_text)
+        except orjson.JSONDecodeError:
+            return instruction_text
+
+    async def _astream_calming(
+        self,
+        ctx: LifeSaverContext,
+        next_step_index: int,
+        done: bool,
+        instruction_task: "asyncio.Task[Any]",
+        step_output: Dict[str, Any],
+        static_message: Optional[str],
+        calming_prompt: str,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream the calming message for a `stream=True` turn, then record the
+        turn once the instruction agent has finished too.
+
+        The turn is recorded even if the caller stops iterating early (with
+        the part of the message shown so far); the instruction call is then
+        cancelled and the protocol's next step (`step_output`) logged in its
+        place.
+        """
+        shown: List[str] = []
+        instruction_output: Any = step_output
+        try:
+            if static_message is not None:
+                shown.append(static_message)
+                yield static_message
+            else:
+                async for chunk in self._astream_text(
+                    runner=self.runners["calming"],
+                    session_id=ctx.session_id,
+                    content_text=calming_prompt,
+                ):
+                    shown.append(chunk)
+                    yield chunk
+                if not "".join(shown).strip():
+                    shown.append(DEFAULT_CALM_MESSAGE)
+                    yield DEFAULT_CALM_MESSAGE
+
+            instruction_output = await instruction_task
+        finally:
+            if not instruction_task.done():
+                instruction_task.cancel()
+            self._finish_turn(
+                ctx,
+                next_step_index,
+                done,
+                instruction_output,
+                "".join(shown),
+                static_message is not None,
+            )
+
+    def _finish_turn(
+        self,
+        ctx: LifeSaverContext,
+        next_step_index: int,
+        done: bool,
+        instruction_output: Any,
+        calming_message: str,
+        static_calm: bool,
+    ) -> None:
+        ctx.add_event("instruction_output", instruction_output)
+        ctx.add_event(
+            "calming_output_cached" if static_calm else "calming_output_raw",
+            calming_message,
+        )
+
+        ctx.current_step_index = next_step_index
+        ctx.done = done
+
+        # Compaction makes a model call, so it runs in the background rather
+        # than holding up the turn; agenerate_emt_report waits for it.
+        if len(ctx.events) > ctx.events_recent_cap and (
+            ctx._compaction_task is None or ctx._compaction_task.done()
+        ):
+            ctx._compaction_task = asyncio.create_task(self._compact_events(ctx))
+
+    def next_instruction(
+        self,
+        ctx: LifeSaverContext,
+        user_update: str,
+    ) -> Dict[str, Any]:
+        """
+        Synchronous wrapper around `anext_instruction` for synchronous callers
+        (scripts, notebooks). Both agents still run concurrently; streaming
+        is only available through `anext_instruction`.
+        """
+        return self._run_sync(self.anext_instruction(ctx, user_update))
+
+    async def anext_instruction_batch(
+        self,
+        ctxs: List[LifeSaverContext],
+        user_updates: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Advance several independent sessions by one turn each, concurrently.
+
+        Results are in the same order as `ctxs`. Each context must belong to
+        a different session: turns of one session have to run in order.
+        """
+        if len(ctxs) != len(user_updates):
+            raise ValueError("ctxs and user_updates must have the same length.")
+        if len({id(ctx) for ctx in ctxs}) != len(ctxs):
+            raise ValueError("Each context may only appear once per batch.")
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.anext_instruction(ctx, user_update)
+                    for ctx, user_update in zip(ctxs, user_updates)
+                )
+            )
+        )
+
+    def next_instruction_batch(
+        self,
+        ctxs: List[LifeSaverContext],
+        user_updates: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Synchronous wrapper around `anext_instruction_batch`.
+        """
+        return self._run_sync(self.anext_instruction_batch(ctxs, user_updates))
+
+    async def _compact_events(self, ctx: LifeSaverContext) -> None:
+        """
+        Fold the oldest half of ctx.events into ctx.events_summary, so the
+        event log (and the EMT prompt built from it) stays bounded no matter
+        how long the session runs.
+
+        The events are only removed once a summary is back; if the call
+        fails (or returns nothing) they stay in the log, and the MAX_EVENTS
+        cap accounts for them if they are evicted later.
+        """
+        snapshot = list(ctx.events)[: len(ctx.events) // 2]
+        payload = {
+            "summary_so_far": ctx.events_summary,
+            "events": [e for e in snapshot if e.type not in EMT_EXCLUDED_EVENT_TYPES],
+        }
+        try:
+            summary = await self._arun_and_get_text(
+                runner=self.runners["emt"],
+                session_id=ctx.session_id,
+                content_text=SUMMARIZE_EVENTS_PROMPT + orjson.dumps(payload).decode(),
+            )
+        except Exception:
+            logger.exception("Event log compaction failed for session %s", ctx.session_id)
+            return
+        if not summary.strip():
+            return
+
+        # Turns logged meanwhile may have pushed some snapshot events out at
+        # the MAX_EVENTS cap; those were counted as dropped, but are in the
+        # summary after all.
+        oldest = ctx.events[0] if ctx.events else None
+        still_logged = next(
+            (i for i, e in enumerate(snapshot) if e is oldest), len(snapshot)
+        )
+        ctx.events_dropped -= sum(
+            e.type not in EMT_EXCLUDED_EVENT_TYPES for e in snapshot[:still_logged]
+        )
+        ctx.drop_oldest_events(len(snapshot) - still_logged)
+        ctx.events_summary = summary
+
+    async def agenerate_emt_report(self, ctx: LifeSaverContext) -> str:
         """
         Summarize the entire session as a handoff report.
         """
-        events_text = json.dumps(ctx.events, indent=2)
-        report = self._run_and_get_text(
-            runner=self.emt_runner,
+        # Let a running compaction finish, so its summary is in the report;
+        # if it failed, its events are still in the log.
+        if ctx._compaction_task is not None:
+            await asyncio.wait((ctx._compaction_task,))
+
+        events_text = "".join(ctx.events_lines)
+        if ctx.events_summary:
+            events_text = (
+                f"Summary of earlier events:\n{ctx.events_summary}\n\n"
+                f"Recent events:\n{events_text}"
+            )
+        if ctx.events_dropped:
+            events_text = (
+                f"Note: {ctx.events_dropped} earlier events were dropped "
+                f"without being summarized.\n\n{events_text}"
+            )
+
+        report = await self._arun_and_get_text(
+            runner=self.runners["emt"],
             session_id=ctx.session_id,
             content_text=events_text,
         )
-        ctx.events.append({"type": "emt_report", "content": report})
+        ctx.add_event("emt_report", report)
         return report
+
+    def generate_emt_report(self, ctx: LifeSaverContext) -> str:
+        """
+        Synchronous wrapper around `agenerate_emt_report`.
+        """
+        return self._run_sync(self.agenerate_emt_report(ctx))
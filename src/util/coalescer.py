@@ -0,0 +1,88 @@
+import asyncio
+import contextlib
+from typing import Any, AsyncGenerator, Dict, List, Tuple
+
+from google.genai import types
+from google.adk.agents.run_config import StreamingMode
+from google.adk.events import Event
+from google.adk.runners import Runner
+
+
+class CoalescingRunner:
+    """
+    Wrapper around an ADK Runner's `run_async` that coalesces identical
+    in-flight calls.
+
+    Every call is dispatched immediately; a call whose prompt text matches
+    one already in flight (on the same event loop) waits for that call and
+    gets its events instead of making a second model call. Events for a
+    coalesced prompt are only recorded in the first caller's ADK session, so
+    only wrap stateless agents (the calming agent). Streaming calls (a
+    run_config with a streaming_mode) are passed straight through, since
+    collecting the events would hold back the stream.
+    Everything except `run_async` is delegated to the wrapped runner.
+    """
+
+    def __init__(self, inner: Runner) -> None:
+        self.inner = inner
+        self._in_flight: Dict[
+            Tuple[asyncio.AbstractEventLoop, str], "asyncio.Task[List[Event]]"
+        ] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    async def run_async(
+        self,
+        *,
+        user_id: str,
+        session_id: str,
+        new_message: types.Content,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Event, None]:
+        run_config = kwargs.get("run_config")
+        if run_config is not None and run_config.streaming_mode != StreamingMode.NONE:
+            events = self.inner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=new_message,
+                **kwargs,
+            )
+            async with contextlib.aclosing(events):
+                async for event in events:
+                    yield event
+            return
+
+        loop = asyncio.get_running_loop()
+        prompt = "".join(part.text or "" for part in new_message.parts or [])
+        key = (loop, prompt)
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = loop.create_task(
+                self._collect(user_id, session_id, new_message, kwargs)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # shield(): a caller that gives up doesn't cancel the call for the
+        # others waiting on it
+        for event in await asyncio.shield(task):
+            yield event
+
+    async def _collect(
+        self,
+        user_id: str,
+        session_id: str,
+        new_message: types.Content,
+        kwargs: Dict[str, Any],
+    ) -> List[Event]:
+        return [
+            event
+            async for event in self.inner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=new_message,
+                **kwargs,
+            )
+        ]
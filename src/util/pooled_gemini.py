@@ -0,0 +1,45 @@
+from typing import Any, Dict
+
+from google.genai import Client, types
+from google.adk.models.google_llm import Gemini
+from google.adk.utils._event_loop_cache import PerLoopCachedProperty
+from pydantic import Field
+
+
+class PooledGemini(Gemini):
+    """
+    Gemini model whose API client also gets `async_client_args` (HTTP/2,
+    connection pool limits, ...).
+
+    Passing `http_options` through `client_kwargs` would replace the options
+    ADK builds itself (tracking headers, retry_options, base_url,
+    api_version), so they are rebuilt here with `async_client_args` merged
+    in, and the rest of the client setup is left to ADK.
+
+    This mirrors ADK's own `Gemini.api_client` and uses its private helpers
+    (PerLoopCachedProperty, _tracking_headers, ...), so google-adk is pinned
+    in requirements.txt; re-check this class when upgrading it.
+    `async_client_args` are httpx arguments: if aiohttp is installed,
+    google.genai sends async requests through aiohttp and ignores them.
+    """
+
+    async_client_args: Dict[str, Any] = Field(default_factory=dict)
+
+    @PerLoopCachedProperty
+    def api_client(self) -> Client:
+        if self.client or not self.async_client_args:
+            return Gemini.api_client.func(self)
+
+        base_url, api_version = self._base_url_and_api_version
+        if api_version is None:
+            api_version = self._configured_api_version()
+        http_options = types.HttpOptions(
+            headers=self._tracking_headers(),
+            retry_options=self.retry_options,
+            base_url=base_url,
+            api_version=api_version or None,
+            async_client_args=self.async_client_args,
+        )
+
+        client_kwargs = {**(self.client_kwargs or {}), "http_options": http_options}
+        return Gemini.api_client.func(self.model_copy(update={"client_kwargs": client_kwargs}))
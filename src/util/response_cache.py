@@ -0,0 +1,108 @@
+import contextlib
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Optional, Tuple
+
+from google.genai import types
+from google.adk.events import Event
+from google.adk.runners import Runner
+
+
+class ExactMatchCache:
+    """
+    Small in-process LRU cache with a per-entry TTL.
+
+    Keys are exact-match digests (see `make_key`); values are the final text
+    responses of an agent.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        sha256 over the given parts (e.g. model, system prompt, user input).
+        """
+        return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class CachedRunner:
+    """
+    Drop-in wrapper around an ADK Runner that answers repeated prompts from
+    an ExactMatchCache instead of calling the model.
+
+    Only use this for stateless, non-medical agents (the calming agent):
+    a cache hit bypasses both the model and the ADK session.
+    Everything except `run_async` is delegated to the wrapped runner.
+    """
+
+    def __init__(self, inner: Runner, cache: ExactMatchCache) -> None:
+        self.inner = inner
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    def _key(self, new_message: types.Content) -> str:
+        agent = self.inner.agent
+        model = agent.model if isinstance(agent.model, str) else agent.model.model
+        user_input = "".join(part.text or "" for part in new_message.parts or [])
+        return self.cache.make_key(model, str(agent.instruction), user_input)
+
+    async def run_async(
+        self,
+        *,
+        user_id: str,
+        session_id: str,
+        new_message: types.Content,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Event, None]:
+        key = self._key(new_message)
+
+        cached_text = self.cache.get(key)
+        if cached_text is not None:
+            yield Event(
+                author=self.inner.agent.name,
+                content=types.Content(role="model", parts=[types.Part(text=cached_text)]),
+            )
+            return
+
+        # aclosing(): if the caller stops early, shut the inner runner down
+        # in this task instead of leaving it to garbage collection
+        events = self.inner.run_async(
+            user_id=user_id,
+            session_id=session_id,
+            new_message=new_message,
+            **kwargs,
+        )
+        async with contextlib.aclosing(events):
+            async for event in events:
+                if event.is_final_response() and event.content and event.content.parts:
+                    part_text = event.content.parts[0].text or ""
+                    if part_text:
+                        # Store before yielding, in case the caller stops early
+                        self.cache.set(key, part_text)
+                yield event
@@ -0,0 +1,80 @@
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Small in-process nearest-neighbour cache keyed by text embeddings.
+
+    Lookups are a cosine-similarity scan (numpy) over at most `max_entries`
+    normalized vectors, which is plenty for caching classification decisions.
+    Only store small, safe-to-reuse decisions here (e.g. a triage label),
+    never free-form medical guidance.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Awaitable[Sequence[float]]],
+        threshold: float = 0.92,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 1000,
+    ) -> None:
+        self._embed_fn = embed_fn
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._vectors: Optional[np.ndarray] = None
+        self._stored_at: List[float] = []
+        self._values: List[Dict[str, Any]] = []
+
+    async def embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Embed and L2-normalize `text`. Returns None if embedding fails, which
+        callers should treat as a cache miss (the cache is best-effort).
+        """
+        try:
+            values = await self._embed_fn(text)
+        except Exception:
+            return None
+
+        vector = np.asarray(values, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return None
+        return vector / norm
+
+    def get(self, embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Return the value of the nearest live entry if its cosine similarity
+        reaches the threshold, else None.
+        """
+        if self._vectors is None:
+            return None
+
+        similarities = self._vectors @ embedding
+        now = time.monotonic()
+        expired = np.array([now - t > self.ttl_seconds for t in self._stored_at])
+        similarities[expired] = -1.0
+
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        return self._values[best]
+
+    def put(self, embedding: np.ndarray, value: Dict[str, Any]) -> None:
+        if self._vectors is None:
+            self._vectors = embedding[np.newaxis, :]
+        else:
+            self._vectors = np.vstack([self._vectors, embedding])
+        self._stored_at.append(time.monotonic())
+        self._values.append(value)
+
+        # Evict oldest entries first
+        overflow = len(self._values) - self.max_entries
+        if overflow > 0:
+            self._vectors = self._vectors[overflow:]
+            del self._stored_at[:overflow]
+            del self._values[:overflow]
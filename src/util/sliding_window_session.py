@@ -0,0 +1,28 @@
+from google.adk.sessions import InMemorySessionService
+
+
+class SlidingWindowSessionService(InMemorySessionService):
+    """
+    InMemorySessionService that can cut a session down to its last
+    `max_events` events.
+
+    The orchestrator keeps its own full event log (LifeSaverContext.events),
+    so the ADK session store would otherwise be an unbounded duplicate of it.
+    Trimming is explicit (`trim_session`) rather than done on every append, so
+    a session is never cut while an invocation still holds a copy of it; call
+    it once an invocation has finished. Agents here run with
+    include_contents="none" and never read history from the session; an
+    agent that does rely on session history needs a larger window.
+    """
+
+    def __init__(self, max_events: int = 8) -> None:
+        super().__init__()
+        self.max_events = max_events
+
+    def trim_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        """
+        Drop all but the last `max_events` events of the stored session.
+        """
+        session = self.sessions.get(app_name, {}).get(user_id, {}).get(session_id)
+        if session is not None and len(session.events) > self.max_events:
+            del session.events[: -self.max_events]